@@ -3,25 +3,74 @@ import tkinter as tk
 from tkinter import messagebox
 import random
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import threading
 import os
+import pickle
 
 BASE_DIR=os.path.dirname(os.path.abspath(__file__))
 WORDLIST_PATH = os.path.join(BASE_DIR, "wordlist.txt")
+
+def _load_or_build_cache(path, min_len, max_len):
+    """
+    Return {length: [words]} for min_len..max_len.
+
+    The parsed wordlist (every alphabetic word, grouped by length) is pickled
+    next to the text file and reused until the text file is modified.
+    """
+    cache_path = path + ".cache.pkl"
+    by_len = None
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "rb") as f:
+                by_len = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        by_len = None
+
+    if by_len is None:
+        by_len = {}
+        # One read, then one word per line; bytes.isalpha() is ASCII-only,
+        # so accented entries are dropped, as are multi-word lines
+        with open(path, "rb") as f:
+            data = f.read().lower()
+        for w in data.splitlines():
+            w = w.strip()
+            if not w.isalpha():
+                continue
+            by_len.setdefault(len(w), []).append(w.decode("ascii"))
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(by_len, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # read-only install (e.g. frozen exe); just skip the cache
+
+    # The list repeats a few words (choir, knack, pearl); drop the extra
+    # copies here so pickles built before this still load clean
+    return {
+        L: list(dict.fromkeys(ws))
+        for L, ws in by_len.items() if min_len <= L <= max_len
+    }
+
 def load_wordlist(min_len=4, max_len=6):
-    words = []
-    with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            w = line.strip().lower()
-            if w.isalpha() and min_len <= len(w) <= max_len:
-                words.append(w)
-    return words
+    by_len = _load_or_build_cache(WORDLIST_PATH, min_len, max_len)
+    return [w for ws in by_len.values() for w in ws]
+
+# One pooled session so repeated lookups reuse a keep-alive connection
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
 
 def fetch_definition(word):
     #dictionaryapi.dev
     url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
     try:
-        r = requests.get(url, timeout =5)
+        r = _session.get(url, timeout =5)
         if r.status_code == 200:
             data = r.json()
             defs =[]
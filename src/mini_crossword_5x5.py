@@ -2,9 +2,15 @@ import tkinter as tk
 from tkinter import messagebox
 import random
 import os
+import atexit
+import re
 import sys
-import requests
+import json
+import threading
+import pickle
 import traceback
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 
 # ------------------------------
 # CONFIGURATION
@@ -18,8 +24,17 @@ if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
 else:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# fill_crossword() gives up after trying this many candidate words
+MAX_FILL_NODES = 2_000_000
+
 WORDLIST_PATH = os.path.join(BASE_DIR, "wordlist.txt")
+LOCAL_DEFS_PATH = os.path.join(BASE_DIR, "defs.json")  # optional, bundled
 LOG_PATH = os.path.join(BASE_DIR, "debug.log")
+DEFINITION_CACHE_PATH = os.path.join(BASE_DIR, "definition_cache.json")
+
+# One private RNG for the whole module (see load_word_index's seed for
+# reproducible puzzles)
+_rng = random.Random()
 
 PATTERN = [
     ".....",
@@ -29,42 +44,196 @@ PATTERN = [
     "....."
 ]
 
+
+def pattern_mask_bytes(pattern):
+    """Flat mask of a pattern: one byte per cell, 1 = white, at r * N + c."""
+    return bytes(ch == "." for row in pattern for ch in row)
+
+
+MASK_BYTES = pattern_mask_bytes(PATTERN)
+
+# A maximal run of white cells in one row or column of a flat mask
+_WHITE_RUN = re.compile(rb"\x01+")
+
 # ------------------------------
 # LOGGING
 # ------------------------------
+# Set CROSSWORD_DEBUG=1 to write debug.log; otherwise log() is a no-op
+DEBUG = os.environ.get("CROSSWORD_DEBUG") == "1"
+_log_fh = None
+
+
+def start_log():
+    """
+    Truncate debug.log and keep one block-buffered handle open for the run;
+    it is flushed and closed at interpreter exit.
+    """
+    global _log_fh
+    if DEBUG and _log_fh is None:
+        _log_fh = open(LOG_PATH, "w", encoding="utf-8", buffering=1 << 16)
+        atexit.register(_log_fh.close)
+
+
 def log(msg: str):
-    with open(LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(msg + "\n")
+    if _log_fh is not None:
+        _log_fh.write(msg + "\n")
 
 
 # ------------------------------
 # WORDLIST LOADING
 # ------------------------------
-def load_words(min_len=5, max_len=5):
-    words = []
-    with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
-        for w in f:
-            w = w.strip().lower()
-            if w.isalpha() and min_len <= len(w) <= max_len:
-                words.append(w)
-    if not words:
-        raise RuntimeError("No usable words found.")
-    return words
 
+def _load_or_build_cache(path, min_len, max_len):
+    """
+    Return {length: [words]} for min_len..max_len.
 
-def build_wordlists(words):
-    result = {}
-    for w in words:
-        result.setdefault(len(w), []).append(w)
-    return result
+    The parsed wordlist (every alphabetic word, grouped by length) is pickled
+    next to the text file and reused until the text file is modified.
+    """
+    cache_path = path + ".cache.pkl"
+    by_len = None
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "rb") as f:
+                by_len = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        by_len = None
+
+    if by_len is None:
+        by_len = {}
+        # One read, then one word per line; bytes.isalpha() is ASCII-only,
+        # so accented entries are dropped, as are multi-word lines
+        with open(path, "rb") as f:
+            data = f.read().lower()
+        for w in data.splitlines():
+            w = w.strip()
+            if not w.isalpha():
+                continue
+            by_len.setdefault(len(w), []).append(w.decode("ascii"))
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(by_len, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # read-only install (e.g. frozen exe); just skip the cache
+
+    # The list repeats a few words (choir, knack, pearl); drop the extra
+    # copies here so pickles built before this still load clean
+    return {
+        L: list(dict.fromkeys(ws))
+        for L, ws in by_len.items() if min_len <= L <= max_len
+    }
+
+
+@lru_cache(maxsize=None)
+def load_words_by_length(min_len=5, max_len=5):
+    by_len = _load_or_build_cache(WORDLIST_PATH, min_len, max_len)
+    if not by_len:
+        raise RuntimeError("No usable words found.")
+    return by_len
+
+
+def build_letter_masks(words_by_length):
+    """masks[L][pos][ch] has bit i set when words_by_length[L][i][pos] == ch."""
+    masks = {}
+    for L, ws in words_by_length.items():
+        per_pos = [{} for _ in range(L)]
+        for i, w in enumerate(ws):
+            bit = 1 << i
+            for pos, ch in enumerate(w):
+                per_pos[pos][ch] = per_pos[pos].get(ch, 0) | bit
+        masks[L] = per_pos
+    return masks
+
+
+@lru_cache(maxsize=None)
+def load_word_index(min_len=5, max_len=5, seed=None):
+    """
+    Return (words_by_length, letter_masks), built once per run.
+
+    Each length's list is shuffled here, once, so every launch fills a
+    different puzzle while the letter masks are only computed a single time.
+    Pass seed to get the same shuffle (and so the same fill) every time.
+    """
+    rng = _rng if seed is None else random.Random(seed)
+    words_by_length = {}
+    for L, ws in load_words_by_length(min_len, max_len).items():
+        ws = ws[:]
+        rng.shuffle(ws)
+        words_by_length[L] = ws
+    return words_by_length, build_letter_masks(words_by_length)
 
 
 # ------------------------------
 # DICTIONARY LOOKUP (CLUES)
 # ------------------------------
-definition_cache = {}
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    One pooled session so repeated lookups reuse a keep-alive connection.
+    requests is imported on first use, so offline/exe runs never load it.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ))
+        return _session
+
+_definition_cache_lock = threading.Lock()
+
+
+def load_definition_cache():
+    try:
+        with open(DEFINITION_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def save_definition_cache():
+    """Write definition_cache to disk atomically (temp file + os.replace)."""
+    with _definition_cache_lock:
+        tmp_path = DEFINITION_CACHE_PATH + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(dict(definition_cache), f)
+            os.replace(tmp_path, DEFINITION_CACHE_PATH)
+        except OSError as e:
+            log(f"Could not save definition cache: {e}")
+
+
+definition_cache = load_definition_cache()
+
+@lru_cache(maxsize=None)
+def load_local_definitions():
+    """{word: definition} from a bundled defs.json, or {} when there is none."""
+    try:
+        with open(LOCAL_DEFS_PATH, "r", encoding="utf-8") as f:
+            defs = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return defs if isinstance(defs, dict) else {}
+
 
 def get_definition(word: str) -> str:
+    # A bundled definition needs no network (and works in the exe too)
+    local = load_local_definitions().get(word)
+    if local:
+        return local
+
     if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
         return f"Clue for {word}"
 
@@ -73,7 +242,7 @@ def get_definition(word: str) -> str:
 
     url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
     try:
-        r = requests.get(url, timeout=5)
+        r = get_session().get(url, timeout=5)
         if r.status_code == 200:
             data = r.json()
             meanings = data[0].get("meanings", [])
@@ -82,6 +251,7 @@ def get_definition(word: str) -> str:
                 if defs:
                     d = defs[0].get("definition", "")
                     if d:
+                        # main() saves once after every lookup is done
                         definition_cache[word] = d
                         return d
     except:
@@ -93,98 +263,207 @@ def get_definition(word: str) -> str:
 # ------------------------------
 # SLOT CREATION
 # ------------------------------
-def build_slots(pattern):
+def attach_cells_and_crossings(slots, grid_size):
+    """
+    Give every slot its flat cell offsets (r * grid_size + c) as
+    slot["cells"], and slot["crossings"] = ((other_idx, my_pos, other_pos), ...)
+    for each cell it shares with another slot.
+    """
+    owners = {}
+    for idx, s in enumerate(slots):
+        step = grid_size if s["dir"] == "down" else 1
+        start = s["row"] * grid_size + s["col"]
+        s["cells"] = range(start, start + step * s["length"], step)
+        for pos, off in enumerate(s["cells"]):
+            owners.setdefault(off, []).append((idx, pos))
+
+    for idx, s in enumerate(slots):
+        s["crossings"] = tuple(
+            (other, pos, other_pos)
+            for pos, off in enumerate(s["cells"])
+            for other, other_pos in owners[off]
+            if other != idx
+        )
+
+
+@lru_cache(maxsize=4)
+def _build_slots_cached(pattern, mask_bytes):
     grid_size = len(pattern)
-    mask = [[c == "." for c in row] for row in pattern]
+    N = grid_size
     slots = []
 
-    # Across
-    for r in range(grid_size):
-        c = 0
-        while c < grid_size:
-            if mask[r][c] and (c == 0 or not mask[r][c - 1]):
-                start = c
-                while c < grid_size and mask[r][c]:
-                    c += 1
-                L = c - start
-                if WORD_MIN <= L <= WORD_MAX:
-                    slots.append({"dir": "across", "row": r, "col": start, "length": L})
-            else:
-                c += 1
-
-    # Down
-    for c in range(grid_size):
-        r = 0
-        while r < grid_size:
-            if mask[r][c] and (r == 0 or not mask[r - 1][c]):
-                start = r
-                while r < grid_size and mask[r][c]:
-                    r += 1
-                L = r - start
+    # Each row is a slice of the flat mask and each column a strided slice,
+    # so one regex pass per line finds every run of white cells
+    for d in ("across", "down"):
+        for i in range(N):
+            line = mask_bytes[i * N:(i + 1) * N] if d == "across" else mask_bytes[i::N]
+            for m in _WHITE_RUN.finditer(line):
+                L = m.end() - m.start()
                 if WORD_MIN <= L <= WORD_MAX:
-                    slots.append({"dir": "down", "row": start, "col": c, "length": L})
-            else:
-                r += 1
+                    r, c = (i, m.start()) if d == "across" else (m.start(), i)
+                    slots.append({"dir": d, "row": r, "col": c, "length": L})
 
-    return mask, slots
+    attach_cells_and_crossings(slots, grid_size)
+    mask = tuple(tuple(bool(b) for b in mask_bytes[r * N:(r + 1) * N])
+                 for r in range(grid_size))
+    return mask, tuple(slots)
+
+
+def build_slots(pattern, mask_bytes=None):
+    """
+    Return a fresh (mask, slots) for pattern; callers may mutate both.
+    mask_bytes is the flat mask (1 = white, index r * N + c), e.g. MASK_BYTES.
+    """
+    if mask_bytes is None:
+        mask_bytes = pattern_mask_bytes(pattern)
+    mask, slots = _build_slots_cached(tuple(pattern), mask_bytes)
+    return [list(row) for row in mask], [dict(s) for s in slots]
 
 
 # ------------------------------
-# GUARANTEED FILL ALGORITHM
+# GUARANTEED FILL ALGORITHM (MRV + FORWARD CHECKING)
 # ------------------------------
-def fill_crossword(mask, slots, words_by_length,
-                   max_restarts=2000, max_attempts_per_slot=200):
+def fill_crossword(mask, slots, words_by_length, letter_masks=None,
+                   max_nodes=MAX_FILL_NODES):
+    """
+    Depth-first backtracking fill:
+    - branch on the open slot with the fewest candidates left (MRV)
+    - after placing a word, prune each crossing slot to the words that
+      share the crossing letter (forward checking)
+    Domains are int bitsets over each length's word list, so a prune is a
+    single AND against a precomputed letter mask. Candidates are tried in
+    list order; load_word_index() shuffles the lists once per run.
+    Gives up and returns failure after max_nodes candidate words (about
+    four seconds), since the fill runs before the window opens.
+    """
     grid_size = len(mask)
-
-    def blank():
-        return [[None if not mask[r][c] else "" for c in range(grid_size)]
-                for r in range(grid_size)]
-
-    def fits(grid, slot, word):
-        r, c, d = slot["row"], slot["col"], slot["dir"]
-        for i, ch in enumerate(word):
-            rr = r + (i if d == "down" else 0)
-            cc = c + (i if d == "across" else 0)
-            existing = grid[rr][cc]
-            if existing not in ("", None, ch):
-                return False
-        return True
-
-    def place(grid, slot, word):
-        r, c, d = slot["row"], slot["col"], slot["dir"]
-        for i, ch in enumerate(word):
-            rr = r + (i if d == "down" else 0)
-            cc = c + (i if d == "across" else 0)
-            grid[rr][cc] = ch
-        slot["word"] = word
-
-    for attempt in range(max_restarts):
-        grid = blank()
-        shuffled = slots[:]
-        random.shuffle(shuffled)
+    n = len(slots)
+
+    if letter_masks is None:
+        letter_masks = build_letter_masks(words_by_length)
+
+    lengths = [slot["length"] for slot in slots]
+    # Specialise each slot's crossings once: (other_idx, my_pos, masks) where
+    # masks is the {letter: bitset} table the other slot is pruned with
+    links = [
+        tuple((other, my_pos, letter_masks[lengths[other]][other_pos])
+              for other, my_pos, other_pos in slot["crossings"])
+        for slot in slots
+    ]
+    # Each slot's candidate list, looked up once rather than per candidate
+    slot_words = [words_by_length.get(L, []) for L in lengths]
+    domains = [(1 << len(ws)) - 1 for ws in slot_words]
+    words = [None] * n
+    # Slots of equal length draw from the same word list; placing a word
+    # strikes its bit from all of them, so with the buckets deduplicated no
+    # word appears twice (an open 5x5 square otherwise loves to repeat its
+    # across words down)
+    same_length = [
+        tuple(j for j in range(n) if j != i and lengths[j] == lengths[i])
+        for i in range(n)
+    ]
+
+    # The search stays in plain Python on purpose: domains are arbitrary-size
+    # ints (which Numba cannot JIT) and every prune is already a C-level AND;
+    # the time goes into the size of the search, not per-node overhead.
+    #
+    # It is also already exact cover with colours (Knuth's Algorithm X/C):
+    # slots are the primary items, (cell, letter) pairs the coloured
+    # secondary ones, MRV picks the item with the fewest rows left, and the
+    # mask AND purifies the crossing rows. A dancing-links matrix would
+    # visit the same nodes while splicing pointers in place of one AND.
+
+    # Ties on domain size go to the slot with the most crossings; folding
+    # the degree into the low bits keeps the MRV key a single int
+    degree = [len(link) for link in links]
+
+    def choose():
+        """Most constrained open slot (MRV), or None once every slot is filled."""
+        best, best_key = None, None
+        for i in range(n):
+            if words[i] is None:
+                key = (domains[i].bit_count() << 6) - degree[i]
+                if best is None or key < best_key:
+                    best, best_key = i, key
+        return best
+
+    # Iterative depth-first search; each frame is
+    # [slot_idx, untried candidate bits, snapshot of all domains on entry].
+    # With ten slots at most, restoring the whole domains array with one
+    # slice assignment is cheaper than logging and replaying each prune.
+    solved = False
+    nodes = 0
+    idx = choose()
+    stack = [] if idx is None else [[idx, domains[idx], domains[:]]]
+    if idx is None:
+        solved = True
+
+    while stack:
+        frame = stack[-1]
+        idx, dom, snapshot = frame
+
+        # Take back whatever this slot's previous candidate changed
+        domains[:] = snapshot
+        words[idx] = None
+        if not dom:
+            stack.pop()
+            continue
+
+        nodes += 1
+        if nodes > max_nodes:
+            log(f"Fill gave up after {max_nodes} candidate words")
+            break
+
+        low = dom & -dom
+        frame[1] = dom ^ low
+        word = slot_words[idx][low.bit_length() - 1]
+
+        # Crossings with placed slots were already enforced when those
+        # slots pruned this domain, so only open neighbours need work
         ok = True
-
-        for slot in shuffled:
-            L = slot["length"]
-            words = words_by_length[L]
-            tries = 0
-            word = random.choice(words)
-
-            while not fits(grid, slot, word):
-                word = random.choice(words)
-                tries += 1
-                if tries > max_attempts_per_slot:
-                    ok = False
-                    break
-            if not ok:
+        for other, my_pos, masks in links[idx]:
+            if words[other] is not None:
+                continue
+            pruned = domains[other] & masks.get(word[my_pos], 0)
+            if not pruned:
+                ok = False
                 break
-
-            place(grid, slot, word)
-
+            domains[other] = pruned
         if ok:
-            return True, grid, shuffled
-
-    return False, None, None
+            for other in same_length[idx]:
+                if words[other] is not None:
+                    continue
+                pruned = domains[other] & ~low
+                if not pruned:
+                    ok = False
+                    break
+                domains[other] = pruned
+        if not ok:
+            continue
+
+        words[idx] = word
+        nxt = choose()
+        if nxt is None:
+            solved = True
+            break
+        stack.append([nxt, domains[nxt], domains[:]])
+
+    if not solved:
+        return False, None, None
+
+    # Write each word into a flat byte grid (0xFF = block, 0 = empty) with
+    # one slice assignment, then expand it into the rows the GUI expects
+    flat = bytearray(0 if cell else 0xFF for row in mask for cell in row)
+    for slot, word in zip(slots, words):
+        cells = slot["cells"]
+        flat[cells.start:cells.stop:cells.step] = word.encode()
+        slot["word"] = word
+    grid = [
+        [None if b == 0xFF else (chr(b) if b else "")
+         for b in flat[r * grid_size:(r + 1) * grid_size]]
+        for r in range(grid_size)
+    ]
+    return True, grid, slots
 
 
 # ------------------------------
@@ -197,32 +476,112 @@ def build_gui(grid, slots):
     frame = tk.Frame(root)
     frame.pack(padx=10, pady=10)
 
-    entries = []
+    CELL_SIZE = 40  # total cell size in pixels
+
+    # One Canvas for the board and a single Entry moved onto the cell being
+    # typed in, rather than an Entry widget per cell
+    canvas = tk.Canvas(frame, width=GRID_SIZE * CELL_SIZE,
+                       height=GRID_SIZE * CELL_SIZE, highlightthickness=0)
+    canvas.pack()
+
+    cell_items = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    letter_items = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    char_grid = [["" for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+
     for r in range(GRID_SIZE):
-        row = []
         for c in range(GRID_SIZE):
-            e = tk.Entry(frame, width=2, font=("Consolas", 18), justify="center")
-            e.grid(row=r, column=c, padx=2, pady=2)
-            row.append(e)
-        entries.append(row)
+            x0, y0 = c * CELL_SIZE, r * CELL_SIZE
+            cell_items[r][c] = canvas.create_rectangle(
+                x0 + 1, y0 + 1, x0 + CELL_SIZE - 1, y0 + CELL_SIZE - 1,
+                fill="white", outline="black",
+            )
+            letter_items[r][c] = canvas.create_text(
+                x0 + CELL_SIZE // 2, y0 + CELL_SIZE // 2,
+                text="", font=("Consolas", 18),
+            )
+
+    entry = tk.Entry(canvas, width=2, font=("Consolas", 18), justify="center",
+                     bd=0, highlightthickness=0)
+    entry_window = canvas.create_window(0, 0, window=entry, state="hidden",
+                                        width=CELL_SIZE - 6, height=CELL_SIZE - 10)
+    current = [None]  # (r, c) under the Entry
+
+    def set_letter(r, c, ch):
+        char_grid[r][c] = ch
+        canvas.itemconfigure(letter_items[r][c], text=ch)
+
+    def set_fill(r, c, color):
+        canvas.itemconfigure(cell_items[r][c], fill=color)
+        if current[0] == (r, c):
+            entry.config(bg=color)
+
+    def select(r, c):
+        current[0] = (r, c)
+        canvas.coords(entry_window, c * CELL_SIZE + CELL_SIZE // 2,
+                      r * CELL_SIZE + CELL_SIZE // 2)
+        canvas.itemconfigure(entry_window, state="normal")
+        entry.config(bg=canvas.itemcget(cell_items[r][c], "fill"))
+        entry.delete(0, tk.END)
+        entry.insert(0, char_grid[r][c])
+        entry.focus_set()
+
+    def on_click(event):
+        r, c = event.y // CELL_SIZE, event.x // CELL_SIZE
+        if 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE:
+            select(r, c)
+
+    def on_key(event):
+        if current[0] is None:
+            return
+        text = entry.get().strip()[-1:]
+        if entry.get() != text:
+            entry.delete(0, tk.END)
+            entry.insert(0, text)
+        set_letter(*current[0], text)
+
+    def on_tab(event):
+        # Tab walks the cells in reading order, like the old Entry grid
+        if current[0] is not None:
+            r, c = current[0]
+            i = (r * GRID_SIZE + c + 1) % (GRID_SIZE * GRID_SIZE)
+            select(*divmod(i, GRID_SIZE))
+        return "break"
+
+    def on_arrow(dr, dc):
+        def handler(event):
+            if current[0] is not None:
+                r, c = current[0]
+                select((r + dr) % GRID_SIZE, (c + dc) % GRID_SIZE)
+            return "break"
+        return handler
+
+    canvas.bind("<Button-1>", on_click)
+    entry.bind("<KeyRelease>", on_key)
+    entry.bind("<Tab>", on_tab)
+    entry.bind("<Up>", on_arrow(-1, 0))
+    entry.bind("<Down>", on_arrow(1, 0))
+    entry.bind("<Left>", on_arrow(0, -1))
+    entry.bind("<Right>", on_arrow(0, 1))
 
     solution = [[grid[r][c] for c in range(GRID_SIZE)] for r in range(GRID_SIZE)]
 
     def check():
         for r in range(GRID_SIZE):
             for c in range(GRID_SIZE):
-                guess = entries[r][c].get().lower()
+                guess = char_grid[r][c].lower()
                 if guess == solution[r][c].lower():
-                    entries[r][c].config(bg="green")
+                    set_fill(r, c, "green")
                 else:
-                    entries[r][c].config(bg="white")
+                    set_fill(r, c, "white")
 
     def reveal():
         for r in range(GRID_SIZE):
             for c in range(GRID_SIZE):
-                entries[r][c].delete(0, tk.END)
-                entries[r][c].insert(0, solution[r][c])
-                entries[r][c].config(bg="lightblue")
+                set_letter(r, c, solution[r][c])
+                set_fill(r, c, "lightblue")
+        if current[0] is not None:
+            entry.delete(0, tk.END)
+            entry.insert(0, char_grid[current[0][0]][current[0][1]])
 
     tk.Button(root, text="Check", command=check).pack(side="left", padx=10)
     tk.Button(root, text="Reveal", command=reveal).pack(side="left", padx=10)
@@ -234,24 +593,24 @@ def build_gui(grid, slots):
 # MAIN
 # ------------------------------
 def main():
-    with open(LOG_PATH, "w") as f:
-        f.write("=== Mini crossword starting ===\n")
+    start_log()
+    log("=== Mini crossword starting ===")
 
     log(f"BASE_DIR = {BASE_DIR}")
     log(f"WORDLIST_PATH = {WORDLIST_PATH}")
 
-    words = load_words()
-    words_by_length = build_wordlists(words)
+    words_by_length, letter_masks = load_word_index()
 
-    log(f"Loaded {len(words)} words.")
-    mask, slots = build_slots(PATTERN)
+    log(f"Loaded {sum(len(ws) for ws in words_by_length.values())} words.")
+    mask, slots = build_slots(tuple(PATTERN), MASK_BYTES)
     log(f"PATTERN RAW = {PATTERN}")
-    for row in PATTERN:
-        log(f"ROW:{repr(row)}  LEN={len(row)}")
+    if DEBUG:
+        for row in PATTERN:
+            log(f"ROW:{repr(row)}  LEN={len(row)}")
     log(f"Slots: {len(slots)}")
     log("Starting fill...")
 
-    success, grid, sl = fill_crossword(mask, slots, words_by_length)
+    success, grid, sl = fill_crossword(mask, slots, words_by_length, letter_masks)
 
     log(f"Success = {success}")
 
@@ -261,8 +620,14 @@ def main():
 
     # Fetch clues
     log("Fetching clues...")
-    for slot in sl:
-        slot["clue"] = get_definition(slot["word"])
+    # Each lookup is network-bound, so fetch them side by side
+    words = [slot["word"] for slot in sl]
+    cached = len(definition_cache)
+    with ThreadPoolExecutor(max_workers=max(1, min(8, len(words)))) as ex:
+        for slot, clue in zip(sl, ex.map(get_definition, words)):
+            slot["clue"] = clue
+    if len(definition_cache) != cached:
+        save_definition_cache()
 
     build_gui(grid, sl)
 
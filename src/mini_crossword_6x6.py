@@ -2,10 +2,18 @@ import tkinter as tk
 from tkinter import messagebox
 import random
 import os
+import atexit
+import re
 import sys
-import requests
+import json
+import time
+import sqlite3
+import hashlib
+import threading
+import pickle
 import traceback
-from openai import OpenAI
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
 
 # ------------------------------
 # CONFIGURATION
@@ -20,8 +28,18 @@ if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
 else:
     BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
+# fill_crossword() gives up after trying this many candidate words
+MAX_FILL_NODES = 2_000_000
+
 WORDLIST_PATH = os.path.join(BASE_DIR, "wordlist.txt")
+LOCAL_DEFS_PATH = os.path.join(BASE_DIR, "defs.json")  # optional, bundled
 LOG_PATH = os.path.join(BASE_DIR, "debug.log")
+CLUE_CACHE_PATH = os.path.join(BASE_DIR, "clues.sqlite")
+LLM_MODEL = "gpt-4o-mini"  # or another model you've enabled
+
+# One private RNG for the whole module (see load_word_index's seed for
+# reproducible puzzles)
+_rng = random.Random()
 
 # Base pattern: 6x6, '.' = white, '#' = block
 # This one has 4 slots, all length 5:
@@ -58,72 +76,256 @@ def flip_vertical(pattern):
     return list(reversed(pattern))
 
 
-def random_pattern(base_pattern):
-    """Return a randomized variant of base_pattern (rotations + flips)."""
+@lru_cache(maxsize=None)
+def pattern_variants(base_pattern):
+    """
+    Every distinct variant of base_pattern (a tuple of rows) under the
+    rotations and flips random_pattern picks from, built once.
+    """
+    variants = []
     p = list(base_pattern)
-
-    # Random rotation: 0, 90, 180, or 270 degrees
-    k = random.randint(0, 3)
-    for _ in range(k):
+    for _ in range(4):
+        for h in (False, True):
+            for v in (False, True):
+                q = flip_horizontal(p) if h else p
+                q = tuple(flip_vertical(q) if v else q)
+                # Rotations and flips overlap (and symmetric patterns repeat),
+                # so keep each layout once; the pick stays uniform
+                if q not in variants:
+                    variants.append(q)
         p = rotate_clockwise(p)
+    return tuple(variants)
 
-    # Random horizontal flip
-    if random.random() < 0.5:
-        p = flip_horizontal(p)
-
-    # Random vertical flip
-    if random.random() < 0.5:
-        p = flip_vertical(p)
 
-    return p
+def random_pattern(base_pattern):
+    """Return a randomized variant of base_pattern (rotations + flips)."""
+    return list(_rng.choice(pattern_variants(tuple(base_pattern))))
 
 
 # ------------------------------
 # LOGGING
 # ------------------------------
+# Set CROSSWORD_DEBUG=1 to write debug.log; otherwise log() is a no-op
+DEBUG = os.environ.get("CROSSWORD_DEBUG") == "1"
+_log_fh = None
+
+
+def start_log():
+    """
+    Truncate debug.log and keep one block-buffered handle open for the run;
+    it is flushed and closed at interpreter exit.
+    """
+    global _log_fh
+    if DEBUG and _log_fh is None:
+        _log_fh = open(LOG_PATH, "w", encoding="utf-8", buffering=1 << 16)
+        atexit.register(_log_fh.close)
+
+
 def log(msg: str):
-    with open(LOG_PATH, "a", encoding="utf-8") as f:
-        f.write(msg + "\n")
+    if _log_fh is not None:
+        _log_fh.write(msg + "\n")
 
 
 # ------------------------------
 # WORDLIST LOADING
 # ------------------------------
-def load_words(min_len=WORD_MIN, max_len=WORD_MAX):
-    words = []
-    with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            w = line.strip().lower()
-            if w.isalpha() and min_len <= len(w) <= max_len:
-                words.append(w)
-    if not words:
-        raise RuntimeError(f"No words of length {min_len}–{max_len} found in wordlist.txt")
-    return words
 
+def _load_or_build_cache(path, min_len, max_len):
+    """
+    Return {length: [words]} for min_len..max_len.
 
-def build_wordlists(words):
-    by_len = {}
-    for w in words:
-        by_len.setdefault(len(w), []).append(w)
+    The parsed wordlist (every alphabetic word, grouped by length) is pickled
+    next to the text file and reused until the text file is modified.
+    """
+    cache_path = path + ".cache.pkl"
+    by_len = None
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "rb") as f:
+                by_len = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        by_len = None
+
+    if by_len is None:
+        by_len = {}
+        # One read, then one word per line; bytes.isalpha() is ASCII-only,
+        # so accented entries are dropped, as are multi-word lines
+        with open(path, "rb") as f:
+            data = f.read().lower()
+        for w in data.splitlines():
+            w = w.strip()
+            if not w.isalpha():
+                continue
+            by_len.setdefault(len(w), []).append(w.decode("ascii"))
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(by_len, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # read-only install (e.g. frozen exe); just skip the cache
+
+    # The list repeats a few words (choir, knack, pearl); drop the extra
+    # copies here so pickles built before this still load clean
+    return {
+        L: list(dict.fromkeys(ws))
+        for L, ws in by_len.items() if min_len <= L <= max_len
+    }
+
+
+@lru_cache(maxsize=None)
+def load_words_by_length(min_len=WORD_MIN, max_len=WORD_MAX):
+    by_len = _load_or_build_cache(WORDLIST_PATH, min_len, max_len)
+    if not by_len:
+        raise RuntimeError(f"No words of length {min_len}–{max_len} found in wordlist.txt")
     return by_len
 
 
+def build_letter_masks(words_by_length):
+    """
+    Bitset index over each length's word list:
+    masks[L][pos][ch] has bit i set when words_by_length[L][i][pos] == ch.
+    """
+    masks = {}
+    for L, ws in words_by_length.items():
+        per_pos = [{} for _ in range(L)]
+        for i, w in enumerate(ws):
+            bit = 1 << i
+            for pos, ch in enumerate(w):
+                per_pos[pos][ch] = per_pos[pos].get(ch, 0) | bit
+        masks[L] = per_pos
+    return masks
+
+
+@lru_cache(maxsize=None)
+def load_word_index(min_len=WORD_MIN, max_len=WORD_MAX, seed=None):
+    """
+    Return (words_by_length, letter_masks), built once per run.
+
+    Each length's list is shuffled here, once, so every launch fills a
+    different puzzle while the letter masks are only computed a single time.
+    Pass seed to get the same shuffle (and so the same fill) every time.
+    """
+    rng = _rng if seed is None else random.Random(seed)
+    words_by_length = {}
+    for L, ws in load_words_by_length(min_len, max_len).items():
+        ws = ws[:]
+        rng.shuffle(ws)
+        words_by_length[L] = ws
+    return words_by_length, build_letter_masks(words_by_length)
+
+
 # ------------------------------
-# DICTIONARY LOOKUP FOR CLUES
+# CLUE CACHE (SQLITE)
 # ------------------------------
-definition_cache = {}
+# Definitions and LLM clues survive between runs in clues.sqlite, so a
+# repeat word costs neither a dictionary request nor an OpenAI call
+_clue_db = None
+_clue_db_lock = threading.Lock()
+
+
+def get_clue_db():
+    global _clue_db
+    if _clue_db is None:
+        _clue_db = sqlite3.connect(CLUE_CACHE_PATH, check_same_thread=False)
+        _clue_db.execute(
+            "CREATE TABLE IF NOT EXISTS cache (key TEXT PRIMARY KEY, value TEXT, ts REAL)"
+        )
+        _clue_db.commit()
+    return _clue_db
 
-def get_definition(word: str) -> str:
-    # For exe builds, avoid network (just show placeholder clue)
-    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
-        return f"Clue for '{word}'"
 
-    if word in definition_cache:
-        return definition_cache[word]
+def cached(ttl_days=30, salt=""):
+    """
+    Cache a function's str results in clues.sqlite for ttl_days.
+
+    The key is sha256 over the function name, salt (e.g. the model name) and
+    the arguments. None results are not stored, so failures are retried.
+    """
+    ttl = ttl_days * 86400
+
+    def decorator(fn):
+        def make_key(args):
+            return hashlib.sha256(
+                json.dumps([fn.__name__, salt, args], sort_keys=True).encode("utf-8")
+            ).hexdigest()
+
+        def lookup(*args):
+            """Cached value for args, or None on a miss (never calls fn)."""
+            try:
+                with _clue_db_lock:
+                    row = get_clue_db().execute(
+                        "SELECT value, ts FROM cache WHERE key = ?", (make_key(args),)
+                    ).fetchone()
+                if row and time.time() - row[1] < ttl:
+                    return row[0]
+            except sqlite3.Error as e:
+                log(f"Clue cache read failed: {e}")
+            return None
+
+        def store(value, *args):
+            """Record value as fn(*args), e.g. when it came from a batch call."""
+            try:
+                with _clue_db_lock:
+                    db = get_clue_db()
+                    db.execute(
+                        "INSERT OR REPLACE INTO cache (key, value, ts) VALUES (?, ?, ?)",
+                        (make_key(args), value, time.time()),
+                    )
+                    db.commit()
+            except sqlite3.Error as e:
+                log(f"Clue cache write failed: {e}")
+
+        @wraps(fn)
+        def wrapper(*args):
+            value = lookup(*args)
+            if value is not None:
+                return value
+            value = fn(*args)
+            if value is not None:
+                store(value, *args)
+            return value
+
+        wrapper.lookup = lookup
+        wrapper.store = store
+        return wrapper
+
+    return decorator
+
 
+# ------------------------------
+# DICTIONARY LOOKUP FOR CLUES
+# ------------------------------
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """
+    One pooled session so repeated lookups reuse a keep-alive connection.
+    requests is imported on first use, so offline/exe runs never load it.
+    """
+    global _session
+    with _session_lock:
+        if _session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+
+            _session = requests.Session()
+            _session.mount("https://", HTTPAdapter(
+                pool_connections=10,
+                pool_maxsize=10,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ))
+        return _session
+
+
+@cached(ttl_days=30)
+def fetch_definition(word: str) -> str | None:
     url = f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}"
     try:
-        r = requests.get(url, timeout=5)
+        r = get_session().get(url, timeout=5)
         if r.status_code == 200:
             data = r.json()
             if isinstance(data, list) and data:
@@ -133,255 +335,500 @@ def get_definition(word: str) -> str:
                     if defs:
                         d = defs[0].get("definition", "")
                         if d:
-                            definition_cache[word] = d
                             return d
     except Exception as e:
         print(f"Error fetching definition for {word}: {e}")
+    return None
+
+
+@lru_cache(maxsize=None)
+def load_local_definitions():
+    """{word: definition} from a bundled defs.json, or {} when there is none."""
+    try:
+        with open(LOCAL_DEFS_PATH, "r", encoding="utf-8") as f:
+            defs = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return defs if isinstance(defs, dict) else {}
+
+
+def get_definition(word: str) -> str:
+    # A bundled definition needs no network (and works in the exe too)
+    local = load_local_definitions().get(word)
+    if local:
+        return local
+
+    # For exe builds, avoid network (just show placeholder clue)
+    if getattr(sys, "frozen", False) and hasattr(sys, "_MEIPASS"):
+        return f"Clue for '{word}'"
+
+    return fetch_definition(word) or "No clue available."
 
-    return "No clue available."
 
 # ------------------------------
 # LLM-BASED CLUE GENERATION
 # ------------------------------
+_openai_client = None
+_openai_client_lock = threading.Lock()
 
-def get_llm_clue(word: str, base_definition: str | None = None) -> str:
-    """
-    Use OpenAI to generate a fun crossword-style clue.
 
-    - Uses the Responses API via the OpenAI Python SDK.
-    - If anything fails (no key, quota, network), falls back to base_definition
-      or a generic safe clue.
+def get_openai_client():
     """
+    One shared client (and connection pool) for every clue worker thread.
+    openai is imported here so runs without an API key never load it.
+    """
+    global _openai_client
+    with _openai_client_lock:
+        if _openai_client is None:
+            from openai import OpenAI
+
+            _openai_client = OpenAI()  # Reads OPENAI_API_KEY from environment
+        return _openai_client
+
+
+# You can customise this "profile" if you like later
+USER_PROFILE = "The solver likes fantasy, and nature, and puzzles."
+
+# Rules for every clue, shared by the single and batch system messages
+CLUE_RULES = (
+    "You are writing clues for a small, friendly crossword puzzle.\n"
+    f"{USER_PROFILE}\n\n"
+    "For each target word (and its dictionary-style definition, if given), "
+    "the clue is fun and concise, in the style of the new york times "
+    "mini crossword clues (max 12 words).\n"
+    "- Do NOT include the word itself or obvious rhymes.\n"
+    "- Keep it easy, not too cryptic.\n"
+    "- Slightly playful tone is okay.\n"
+)
+
+# Each is identical on every call, so OpenAI can serve it from its prompt cache
+CLUE_SYSTEM_PREFIX = CLUE_RULES + (
+    "\nWrite ONE clue for the target word. Output only the clue text, "
+    "no quotes, no extra commentary."
+)
+CLUE_BATCH_SYSTEM = CLUE_RULES + (
+    "\nYou get a JSON list of entries (w = word, d = definition or null). "
+    'Reply with a JSON object {"clues": [...]} holding one clue string per '
+    "entry, in the same order, and nothing else."
+)
+
+# Makes the batch reply a parseable {"clues": [...]} object
+CLUE_BATCH_FORMAT = {
+    "format": {
+        "type": "json_schema",
+        "name": "clue_list",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "clues": {"type": "array", "items": {"type": "string"}},
+            },
+            "required": ["clues"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+@cached(ttl_days=30, salt=LLM_MODEL)
+def fetch_llm_clue(word: str, base_definition: str | None = None) -> str | None:
+    """Ask OpenAI for one clue; None on any failure so it is not cached."""
     try:
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            # No key -> we cannot call OpenAI
-            return base_definition or f"A word related to '{word}'."
-
-        client = OpenAI()  # Reads OPENAI_API_KEY from environment
-
-        # You can customise this "profile" if you like later
-        user_profile = "The solver likes fantasy, and nature, and puzzles."
+        client = get_openai_client()
 
+        # Only the word/definition varies; the shared prefix stays first
         if base_definition:
             prompt = (
-                f"You are writing clues for a small, friendly crossword puzzle.\n"
-                f"{user_profile}\n\n"
                 f"Target word: {word}\n"
-                f"Dictionary-style definition: {base_definition}\n\n"
-                f"Write ONE fun, concise crossword clue, in the style of the new york times mini crossword clues (max 12 words).\n"
-                f"- Do NOT include the word itself or obvious rhymes.\n"
-                f"- Keep it easy, not too cryptic.\n"
-                f"- Slightly playful tone is okay.\n"
-                f"- Output only the clue text, no quotes, no extra commentary."
+                f"Dictionary-style definition: {base_definition}"
             )
         else:
-            prompt = (
-                f"You are writing clues for a small, friendly crossword puzzle.\n"
-                f"{user_profile}\n\n"
-                f"Target word: {word}\n\n"
-                f"Write ONE fun, concise crossword clue, in the style of the new york times mini crossword clues (max 12 words).\n"
-                f"- Do NOT include the word itself or obvious rhymes.\n"
-                f"- Keep it easy, not too cryptic.\n"
-                f"- Slightly playful tone is okay.\n"
-                f"- Output only the clue text, no quotes, no extra commentary."
-            )
+            prompt = f"Target word: {word}"
 
         response = client.responses.create(
-            model="gpt-4o-mini",  # or another model you've enabled
-            input=prompt,
+            model=LLM_MODEL,
+            input=[
+                {"role": "system", "content": CLUE_SYSTEM_PREFIX},
+                {"role": "user", "content": prompt},
+            ],
         )
 
         # New SDK gives you a convenience helper:
-        clue_text = response.output_text.strip()
-
-        if not clue_text:
-            return base_definition or f"A word related to '{word}'."
-
-        return clue_text
+        return response.output_text.strip() or None
 
     except Exception as e:
         # Never crash the app because of AI issues; just log and fall back
         log(f"LLM clue error for {word}: {e}")
-        return base_definition or f"A word related to '{word}'."
+        return None
+
+
+def get_llm_clue(word: str, base_definition: str | None = None) -> str:
+    """
+    Use OpenAI to generate a fun crossword-style clue.
+
+    - Uses the Responses API via the OpenAI Python SDK.
+    - Clues are cached in clues.sqlite, so repeat words cost nothing.
+    - If anything fails (no key, quota, network), falls back to base_definition
+      or a generic safe clue.
+    """
+    if os.getenv("OPENAI_API_KEY"):
+        clue_text = fetch_llm_clue(word, base_definition)
+        if clue_text:
+            return clue_text
+
+    # No key (or no usable answer) -> fall back
+    return base_definition or f"A word related to '{word}'."
+
+
+# Inflection glosses ("Plural of lake.") hand the answer over
+_GIVEAWAY_DEF = re.compile(
+    r"\b(plural|tense|participle|singular|form|spelling|comparative|superlative)"
+    r"\s+(form\s+)?of\b",
+    re.IGNORECASE,
+)
+_INFLECTIONS = ("ing", "ies", "est", "ed", "es", "er", "ly", "s")
+
+
+def _word_stems(word: str) -> set[str]:
+    """The word plus its likely stems (lakes -> lake, lak), 3+ letters each."""
+    word = word.lower()
+    stems = {word}
+    for suffix in _INFLECTIONS:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 3:
+            stems.add(word[: -len(suffix)])
+    return stems
+
+
+def definition_is_clue(word: str, definition: str | None) -> bool:
+    """
+    True when a dictionary definition already reads as a fair clue.
+
+    It must be short, name neither the word nor its stem, not be an
+    inflection gloss, and read as a finished phrase: ending in punctuation
+    or opening like a noun phrase ("A ...", "The ..."). Anything else is
+    left to the LLM.
+    """
+    if not definition or definition == "No clue available.":
+        return False
+    tokens = re.findall(r"[a-z]+", definition.lower())
+    if not tokens or len(tokens) > 12 or _GIVEAWAY_DEF.search(definition):
+        return False
+    stems = _word_stems(word)
+    if any(t.startswith(stem) for t in tokens for stem in stems):
+        return False
+    return definition.rstrip()[-1] in ".!?)" or tokens[0] in ("a", "an", "the")
+
+
+def _parse_clue_list(text: str, count: int) -> list[str] | None:
+    """The batch reply as a list of count clue strings, or None if malformed."""
+    text = text.strip()
+    if text.startswith("```"):
+        # Tolerate a ```json fenced reply
+        text = text.strip("`").removeprefix("json").strip()
+    try:
+        clues = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(clues, dict):
+        clues = clues.get("clues")
+    if (
+        not isinstance(clues, list)
+        or len(clues) != count
+        or not all(isinstance(c, str) and c.strip() for c in clues)
+    ):
+        return None
+    return [c.strip() for c in clues]
+
+
+def get_llm_clues(words: list[str], base_defs: list[str]) -> list[str]:
+    """
+    Clues for every word with one OpenAI request instead of one per slot.
+
+    Usable definitions and cached clues are kept; the rest go out as a
+    single JSON list, answered as a schema-checked {"clues": [...]} object.
+    If the reply can't be parsed, each missing clue is fetched on its own.
+    """
+    if not os.getenv("OPENAI_API_KEY"):
+        return [get_llm_clue(w, d) for w, d in zip(words, base_defs)]
+
+    # A short definition that doesn't give the answer away is used as is
+    clues = [
+        d if definition_is_clue(w, d) else fetch_llm_clue.lookup(w, d)
+        for w, d in zip(words, base_defs)
+    ]
+    missing = [i for i, c in enumerate(clues) if c is None]
+
+    if len(missing) > 1:
+        payload = [{"w": words[i], "d": base_defs[i]} for i in missing]
+        try:
+            response = get_openai_client().responses.create(
+                model=LLM_MODEL,
+                input=[
+                    {"role": "system", "content": CLUE_BATCH_SYSTEM},
+                    {"role": "user", "content": json.dumps(payload)},
+                ],
+                text=CLUE_BATCH_FORMAT,
+            )
+            batch = _parse_clue_list(response.output_text, len(missing))
+            if batch is None:
+                log("LLM batch reply was malformed; fetching clues one by one")
+            else:
+                for i, clue in zip(missing, batch):
+                    clues[i] = clue
+                    fetch_llm_clue.store(clue, words[i], base_defs[i])
+                missing = []
+        except Exception as e:
+            log(f"LLM batch clue error: {e}")
+
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(8, len(missing))) as ex:
+            fallback = ex.map(lambda i: get_llm_clue(words[i], base_defs[i]), missing)
+            for i, clue in zip(missing, fallback):
+                clues[i] = clue
+
+    return clues
 
 # ------------------------------
 # BUILD MASK AND SLOTS
 # ------------------------------
-def build_slots(pattern):
+def attach_cells_and_crossings(slots, grid_size):
+    """
+    Give every slot its flat cell offsets (r * grid_size + c) as
+    slot["cells"], and slot["crossings"] = ((other_idx, my_pos, other_pos), ...)
+    for each cell it shares with another slot.
+    """
+    owners = {}
+    for idx, s in enumerate(slots):
+        step = grid_size if s["dir"] == "down" else 1
+        start = s["row"] * grid_size + s["col"]
+        s["cells"] = range(start, start + step * s["length"], step)
+        for pos, off in enumerate(s["cells"]):
+            owners.setdefault(off, []).append((idx, pos))
+
+    for idx, s in enumerate(slots):
+        s["crossings"] = tuple(
+            (other, pos, other_pos)
+            for pos, off in enumerate(s["cells"])
+            for other, other_pos in owners[off]
+            if other != idx
+        )
+
+
+# A maximal run of white cells in one row or column of a flat mask
+_WHITE_RUN = re.compile(rb"\x01+")
+
+
+@lru_cache(maxsize=8)
+def _build_slots_cached(pattern):
     """
     Build mask and slots from a pattern, then
     remove any 'orphan' white cells that do not belong
     to a valid slot (length between WORD_MIN and WORD_MAX).
     """
     grid_size = len(pattern)
-    mask = [[c == "." for c in row] for row in pattern]
-
-    def slots_from_mask(mask_in):
-        slots_out = []
-
-        # Across
-        for r in range(grid_size):
-            c = 0
-            while c < grid_size:
-                if mask_in[r][c] and (c == 0 or not mask_in[r][c - 1]):
-                    start = c
-                    while c < grid_size and mask_in[r][c]:
-                        c += 1
-                    length = c - start
-                    if WORD_MIN <= length <= WORD_MAX:
-                        slots_out.append({
-                            "dir": "across",
-                            "row": r,
-                            "col": start,
-                            "length": length,
-                        })
-                else:
-                    c += 1
-
-        # Down
-        for c in range(grid_size):
-            r = 0
-            while r < grid_size:
-                if mask_in[r][c] and (r == 0 or not mask_in[r - 1][c]):
-                    start = r
-                    while r < grid_size and mask_in[r][c]:
-                        r += 1
-                    length = r - start
+    N = grid_size
+
+    def valid_runs(flat):
+        """(dir, row, col, length) for every white run of a valid length."""
+        for d in ("across", "down"):
+            for i in range(N):
+                # Rows are slices of the flat mask and columns strided slices
+                line = flat[i * N:(i + 1) * N] if d == "across" else flat[i::N]
+                for m in _WHITE_RUN.finditer(line):
+                    length = m.end() - m.start()
                     if WORD_MIN <= length <= WORD_MAX:
-                        slots_out.append({
-                            "dir": "down",
-                            "row": start,
-                            "col": c,
-                            "length": length,
-                        })
-                else:
-                    r += 1
-
-        return slots_out
-
-    # 1) First pass: find slots from the raw mask
-    initial_slots = slots_from_mask(mask)
+                        r, c = (i, m.start()) if d == "across" else (m.start(), i)
+                        yield d, r, c, length
+
+    # 1) Mark the cells covered by a valid run in either direction; every
+    #    other white cell is an orphan, so this bitmap IS the cleaned mask
+    raw = bytes(ch == "." for row in pattern for ch in row)
+    used = bytearray(N * N)
+    for d, r, c, length in valid_runs(raw):
+        step = N if d == "down" else 1
+        start = r * N + c
+        used[start:start + step * length:step] = b"\x01" * length
+
+    # 2) Build the slots from the cleaned mask. This can't reuse step 1's
+    #    runs: blocking an orphan can cut a too-long run down to a valid one
+    final_slots = [
+        {"dir": d, "row": r, "col": c, "length": length}
+        for d, r, c, length in valid_runs(bytes(used))
+    ]
 
-    # 2) Mark which cells are actually used by at least one valid slot
-    used = [[False] * grid_size for _ in range(grid_size)]
-    for s in initial_slots:
-        r, c, d, length = s["row"], s["col"], s["dir"], s["length"]
-        for i in range(length):
-            rr = r + (i if d == "down" else 0)
-            cc = c + (i if d == "across" else 0)
-            used[rr][cc] = True
+    attach_cells_and_crossings(final_slots, grid_size)
 
-    # 3) Any white cell not used by any slot becomes a block
-    for r in range(grid_size):
-        for c in range(grid_size):
-            if mask[r][c] and not used[r][c]:
-                mask[r][c] = False  # turn into black cell
+    mask = tuple(tuple(bool(b) for b in used[r * N:(r + 1) * N]) for r in range(N))
+    return mask, tuple(final_slots)
 
-    # 4) Recompute slots based on the cleaned mask
-    final_slots = slots_from_mask(mask)
 
-    return mask, final_slots
+def build_slots(pattern):
+    """Return a fresh (mask, slots) for pattern; callers may mutate both."""
+    mask, slots = _build_slots_cached(tuple(pattern))
+    return [list(row) for row in mask], [dict(s) for s in slots]
 
 def assign_numbers(mask, slots):
     """Number only *real* slots, no stray numbers."""
     grid_size = len(mask)
     number_grid = [[0] * grid_size for _ in range(grid_size)]
 
-    # Map from real slot starts to slot index
-    start_map = {}
-    for idx, s in enumerate(slots):
-        start_map[(s["row"], s["col"], s["dir"])] = idx
-
-    num = 1
-    for r in range(grid_size):
-        for c in range(grid_size):
-            if not mask[r][c]:
-                continue
-
-            has_across = (r, c, "across") in start_map
-            has_down   = (r, c, "down")   in start_map
-
-            if has_across or has_down:
-                number_grid[r][c] = num
-                if has_across:
-                    slots[start_map[(r, c, "across")]]["number"] = num
-                if has_down:
-                    slots[start_map[(r, c, "down")]]["number"] = num
-                num += 1
+    # Numbers go to slot starts in reading order, so sorting the (row, col)
+    # starts numbers them without scanning every cell of the mask
+    starts = sorted({(s["row"], s["col"]) for s in slots})
+    numbers = {start: num for num, start in enumerate(starts, 1)}
+    for (r, c), num in numbers.items():
+        number_grid[r][c] = num
+    for s in slots:
+        s["number"] = numbers[(s["row"], s["col"])]
 
     return number_grid, slots
 
 
 # ------------------------------
-# FILL ALGORITHM (MULTI-RESTART)
+# FILL ALGORITHM (MRV + FORWARD CHECKING)
 # ------------------------------
-def fill_crossword(mask, slots, words_by_length,
-                   max_restarts=2000, max_attempts_per_slot=300):
+def fill_crossword(mask, slots, words_by_length, letter_masks=None,
+                   max_nodes=MAX_FILL_NODES):
+    """
+    Fill every slot with depth-first backtracking:
+    - always branch on the open slot with the fewest candidates left (MRV)
+    - after placing a word, prune each crossing slot down to the words
+      that share the crossing letter (forward checking)
+    Domains are int bitsets over each length's word list, so a prune is a
+    single AND against a precomputed letter mask. Candidates are tried in
+    list order; load_word_index() shuffles the lists once per run.
+    Gives up and returns failure after max_nodes candidate words (about
+    four seconds), since the fill runs before the window opens.
+    """
     grid_size = len(mask)
 
-    def make_blank():
-        return [
-            [None if not mask[r][c] else "" for c in range(grid_size)]
-            for r in range(grid_size)
-        ]
-
-    def fits(grid, slot, word):
-        r, c, d = slot["row"], slot["col"], slot["dir"]
-        for i, ch in enumerate(word):
-            rr = r + (i if d == "down" else 0)
-            cc = c + (i if d == "across" else 0)
-            existing = grid[rr][cc]
-            if existing not in ("", None, ch):
-                return False
-        return True
-
-    def place(grid, slot, word):
-        r, c, d = slot["row"], slot["col"], slot["dir"]
-        for i, ch in enumerate(word):
-            rr = r + (i if d == "down" else 0)
-            cc = c + (i if d == "across" else 0)
-            grid[rr][cc] = ch
-        slot["word"] = word
-
     slots_copy = [dict(s) for s in slots]
+    n = len(slots_copy)
+
+    if letter_masks is None:
+        letter_masks = build_letter_masks(words_by_length)
+
+    lengths = [s["length"] for s in slots_copy]
+    # Specialise each slot's crossings once: (other_idx, my_pos, masks) where
+    # masks is the {letter: bitset} table the other slot is pruned with
+    links = [
+        tuple((other, my_pos, letter_masks[lengths[other]][other_pos])
+              for other, my_pos, other_pos in s["crossings"])
+        for s in slots_copy
+    ]
+    # Each slot's candidate list, looked up once rather than per candidate
+    slot_words = [words_by_length.get(L, []) for L in lengths]
+    domains = [(1 << len(ws)) - 1 for ws in slot_words]
+    words = [None] * n
+    # Slots of equal length draw from the same word list; placing a word
+    # strikes its bit from all of them, so with the buckets deduplicated no
+    # word appears twice
+    same_length = [
+        tuple(j for j in range(n) if j != i and lengths[j] == lengths[i])
+        for i in range(n)
+    ]
 
-    for attempt in range(max_restarts):
-        grid = make_blank()
-        for s in slots_copy:
-            s.pop("word", None)
-
-        order = list(range(len(slots_copy)))
-        random.shuffle(order)
+    # The search stays in plain Python on purpose: domains are arbitrary-size
+    # ints (which Numba cannot JIT) and every prune is already a C-level AND;
+    # the time goes into the size of the search, not per-node overhead.
+    #
+    # It is also already exact cover with colours (Knuth's Algorithm X/C):
+    # slots are the primary items, (cell, letter) pairs the coloured
+    # secondary ones, MRV picks the item with the fewest rows left, and the
+    # mask AND purifies the crossing rows. A dancing-links matrix would
+    # visit the same nodes while splicing pointers in place of one AND.
+
+    # Ties on domain size go to the slot with the most crossings; folding
+    # the degree into the low bits keeps the MRV key a single int
+    degree = [len(link) for link in links]
+
+    def choose():
+        """Most constrained open slot (MRV), or None once every slot is filled."""
+        best, best_key = None, None
+        for i in range(n):
+            if words[i] is None:
+                key = (domains[i].bit_count() << 6) - degree[i]
+                if best is None or key < best_key:
+                    best, best_key = i, key
+        return best
+
+    # Iterative depth-first search; each frame is
+    # [slot_idx, untried candidate bits, snapshot of all domains on entry].
+    # A 6x6 board has a dozen slots at most, so restoring the whole domains
+    # array with one slice assignment is cheaper than logging each prune.
+    solved = False
+    nodes = 0
+    idx = choose()
+    stack = [] if idx is None else [[idx, domains[idx], domains[:]]]
+    if idx is None:
+        solved = True
+
+    while stack:
+        frame = stack[-1]
+        idx, dom, snapshot = frame
+
+        # Take back whatever this slot's previous candidate changed
+        domains[:] = snapshot
+        words[idx] = None
+        if not dom:
+            stack.pop()
+            continue
+
+        nodes += 1
+        if nodes > max_nodes:
+            log(f"Fill gave up after {max_nodes} candidate words")
+            break
+
+        low = dom & -dom
+        frame[1] = dom ^ low
+        word = slot_words[idx][low.bit_length() - 1]
+
+        # Crossings with placed slots were already enforced when those
+        # slots pruned this domain, so only open neighbours need work
         ok = True
-
-        for idx in order:
-            slot = slots_copy[idx]
-            L = slot["length"]
-            candidates = words_by_length.get(L, [])
-            if not candidates:
+        for other, my_pos, masks in links[idx]:
+            if words[other] is not None:
+                continue
+            pruned = domains[other] & masks.get(word[my_pos], 0)
+            if not pruned:
                 ok = False
                 break
-
-            tries = 0
-            word = random.choice(candidates)
-
-            while not fits(grid, slot, word):
-                word = random.choice(candidates)
-                tries += 1
-                if tries > max_attempts_per_slot:
+            domains[other] = pruned
+        if ok:
+            for other in same_length[idx]:
+                if words[other] is not None:
+                    continue
+                pruned = domains[other] & ~low
+                if not pruned:
                     ok = False
                     break
-
-            if not ok:
-                break
-
-            place(grid, slot, word)
-
-        if ok:
-            return True, grid, slots_copy
-
-    return False, None, slots_copy
+                domains[other] = pruned
+        if not ok:
+            continue
+
+        words[idx] = word
+        nxt = choose()
+        if nxt is None:
+            solved = True
+            break
+        stack.append([nxt, domains[nxt], domains[:]])
+
+    if not solved:
+        return False, None, slots_copy
+
+    # Write each word into a flat byte grid (0xFF = block, 0 = empty) with
+    # one slice assignment, then expand it into the rows the GUI expects
+    flat = bytearray(0 if cell else 0xFF for row in mask for cell in row)
+    for slot, word in zip(slots_copy, words):
+        cells = slot["cells"]
+        flat[cells.start:cells.stop:cells.step] = word.encode()
+        slot["word"] = word
+    grid = [
+        [None if b == 0xFF else (chr(b) if b else "")
+         for b in flat[r * grid_size:(r + 1) * grid_size]]
+        for r in range(grid_size)
+    ]
+    return True, grid, slots_copy
 
 
 # ------------------------------
@@ -397,51 +844,109 @@ def build_gui(grid, number_grid, slots_with_clues, pattern_used):
     frame = tk.Frame(root)
     frame.pack(padx=10, pady=10)
 
-    entry_grid = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-
     CELL_SIZE = 40  # total cell size in pixels
 
+    # The whole board is one Canvas; a single Entry is moved onto whichever
+    # cell is being typed in, instead of a Frame/Label/Entry per cell.
+    canvas = tk.Canvas(frame, width=GRID_SIZE * CELL_SIZE,
+                       height=GRID_SIZE * CELL_SIZE, highlightthickness=0)
+    canvas.pack()
+
+    cell_items = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    letter_items = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    char_grid = [["" for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+
     for r in range(GRID_SIZE):
         for c in range(GRID_SIZE):
             is_block = grid[r][c] is None
+            x0, y0 = c * CELL_SIZE, r * CELL_SIZE
 
-            cell_bg = "black" if is_block else "white"
-            cell = tk.Frame(frame, width=CELL_SIZE, height=CELL_SIZE,
-                            bg=cell_bg, bd=1, relief="solid")
-            cell.grid(row=r, column=c, padx=1, pady=1)
-            cell.grid_propagate(False)
-
+            cell_items[r][c] = canvas.create_rectangle(
+                x0 + 1, y0 + 1, x0 + CELL_SIZE - 1, y0 + CELL_SIZE - 1,
+                fill="black" if is_block else "white", outline="black",
+            )
             if is_block:
                 continue
 
-            cell.rowconfigure(0, weight=1)
-            cell.rowconfigure(1, weight=3)
-            cell.columnconfigure(0, weight=1)
-
-            # Number label (small, top-left)
+            # Number (small, top-left)
             if number_grid[r][c]:
-                num_label = tk.Label(
-                    cell,
-                    text=str(number_grid[r][c]),
-                    font=("Arial", 8),
-                    bg=cell_bg,
-                    fg="black",
-                    anchor="nw"
-                )
-                num_label.grid(row=0, column=0, sticky="nw", padx=1, pady=0)
-
-            # Entry for the letter
-            e = tk.Entry(
-                cell,
-                width=2,
-                font=("Consolas", 18),
-                justify="center",
-                bd=0,
-                highlightthickness=0,
+                canvas.create_text(x0 + 3, y0 + 2, text=str(number_grid[r][c]),
+                                   font=("Arial", 8), anchor="nw")
+
+            letter_items[r][c] = canvas.create_text(
+                x0 + CELL_SIZE // 2, y0 + CELL_SIZE // 2 + 4,
+                text="", font=("Consolas", 18),
             )
-            e.grid(row=1, column=0, sticky="nsew", pady=(0, 2))
 
-            entry_grid[r][c] = e
+    entry = tk.Entry(canvas, width=2, font=("Consolas", 18), justify="center",
+                     bd=0, highlightthickness=0)
+    entry_window = canvas.create_window(0, 0, window=entry, state="hidden",
+                                        width=CELL_SIZE - 6, height=CELL_SIZE - 14)
+    current = [None]  # (r, c) under the Entry
+
+    white_cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)
+                   if grid[r][c] is not None]
+
+    def set_letter(r, c, ch):
+        char_grid[r][c] = ch
+        canvas.itemconfigure(letter_items[r][c], text=ch)
+
+    def set_fill(r, c, color):
+        canvas.itemconfigure(cell_items[r][c], fill=color)
+        if current[0] == (r, c):
+            entry.config(bg=color)
+
+    def select(r, c):
+        current[0] = (r, c)
+        canvas.coords(entry_window, c * CELL_SIZE + CELL_SIZE // 2,
+                      r * CELL_SIZE + CELL_SIZE // 2 + 4)
+        canvas.itemconfigure(entry_window, state="normal")
+        entry.config(bg=canvas.itemcget(cell_items[r][c], "fill"))
+        entry.delete(0, tk.END)
+        entry.insert(0, char_grid[r][c])
+        entry.focus_set()
+
+    def on_click(event):
+        r, c = event.y // CELL_SIZE, event.x // CELL_SIZE
+        if 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE and grid[r][c] is not None:
+            select(r, c)
+
+    def on_key(event):
+        if current[0] is None:
+            return
+        text = entry.get().strip()[-1:]
+        if entry.get() != text:
+            entry.delete(0, tk.END)
+            entry.insert(0, text)
+        set_letter(*current[0], text)
+
+    def on_tab(event):
+        # Tab walks the white cells in reading order, like the old Entry grid
+        if current[0] is not None:
+            i = white_cells.index(current[0])
+            select(*white_cells[(i + 1) % len(white_cells)])
+        return "break"
+
+    def on_arrow(dr, dc):
+        # Step in one direction, skipping blocks and wrapping at the edge
+        def handler(event):
+            if current[0] is not None:
+                r, c = current[0]
+                for _ in range(GRID_SIZE):
+                    r, c = (r + dr) % GRID_SIZE, (c + dc) % GRID_SIZE
+                    if grid[r][c] is not None:
+                        select(r, c)
+                        break
+            return "break"
+        return handler
+
+    canvas.bind("<Button-1>", on_click)
+    entry.bind("<KeyRelease>", on_key)
+    entry.bind("<Tab>", on_tab)
+    entry.bind("<Up>", on_arrow(-1, 0))
+    entry.bind("<Down>", on_arrow(1, 0))
+    entry.bind("<Left>", on_arrow(0, -1))
+    entry.bind("<Right>", on_arrow(0, 1))
 
     solution = grid
 
@@ -450,29 +955,25 @@ def build_gui(grid, number_grid, slots_with_clues, pattern_used):
             for c in range(GRID_SIZE):
                 if solution[r][c] is None:
                     continue
-                e = entry_grid[r][c]
-                if e is None:
-                    continue
-                guess = e.get().strip().lower()
+                guess = char_grid[r][c].strip().lower()
                 correct = solution[r][c].lower()
                 if not guess:
                     continue
                 if guess == correct:
-                    e.config(bg="pale green")
+                    set_fill(r, c, "pale green")
                 else:
-                    e.config(bg="white")
+                    set_fill(r, c, "white")
 
     def reveal():
         for r in range(GRID_SIZE):
             for c in range(GRID_SIZE):
                 if solution[r][c] is None:
                     continue
-                e = entry_grid[r][c]
-                if e is None:
-                    continue
-                e.delete(0, tk.END)
-                e.insert(0, solution[r][c])
-                e.config(bg="light blue")
+                set_letter(r, c, solution[r][c])
+                set_fill(r, c, "light blue")
+        if current[0] is not None:
+            entry.delete(0, tk.END)
+            entry.insert(0, char_grid[current[0][0]][current[0][1]])
 
     button_frame = tk.Frame(root)
     button_frame.pack(pady=10)
@@ -501,30 +1002,30 @@ def build_gui(grid, number_grid, slots_with_clues, pattern_used):
 # ------------------------------
 def main():
 
-    with open(LOG_PATH, "w", encoding="utf-8") as f:
-        f.write("=== Mini crossword starting ===\n")
+    start_log()
+    log("=== Mini crossword starting ===")
 
     try:
         log(f"BASE_DIR = {BASE_DIR}")
         log(f"WORDLIST_PATH = {WORDLIST_PATH}")
 
-        words = load_words()
-        words_by_length = build_wordlists(words)
-        log(f"Loaded {len(words)} words.")
+        words_by_length, letter_masks = load_word_index()
+        log(f"Loaded {sum(len(ws) for ws in words_by_length.values())} words.")
 
         # Pick a random pattern variant
         pattern = random_pattern(BASE_PATTERN)
         log(f"Pattern used: {pattern}")
 
-        mask, slots = build_slots(pattern)
+        mask, slots = build_slots(tuple(pattern))
         log(f"Slots: {len(slots)}")
-        for s in slots:
-            log(f"Slot: {s}")
+        if DEBUG:
+            for s in slots:
+                log(f"Slot: {s}")
 
         number_grid, slots = assign_numbers(mask, slots)
 
         log("Starting fill...")
-        success, grid, slots_filled = fill_crossword(mask, slots, words_by_length)
+        success, grid, slots_filled = fill_crossword(mask, slots, words_by_length, letter_masks)
         log(f"Success = {success}")
 
         if not success:
@@ -532,17 +1033,14 @@ def main():
             return
 
         log("Fetching clues...")
-        for s in slots_filled:
-            word = s["word"]
-
-            # 1) Get a safe dictionary-style definition
-            base_def = get_definition(word)
-
-            # 2) Ask the LLM to jazz it up
-            fancy_clue = get_llm_clue(word, base_definition=base_def)
-
-            # 3) Use the LLM clue as the one shown in the UI
-            s["clue"] = fancy_clue
+        # Definitions are network-bound, so fetch them side by side, then
+        # let the LLM jazz them all up in one request
+        words = [s["word"] for s in slots_filled]
+        with ThreadPoolExecutor(max_workers=max(1, min(8, len(words)))) as ex:
+            base_defs = list(ex.map(get_definition, words))
+        for s, clue in zip(slots_filled, get_llm_clues(words, base_defs)):
+            # Use the LLM clue as the one shown in the UI
+            s["clue"] = clue
 
         build_gui(grid, number_grid, slots_filled, pattern_used=pattern)
 
@@ -1,7 +1,14 @@
 import tkinter as tk
 import random
 import os
+import pickle
+import json
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # ------------------------------
 # CONFIGURATION
@@ -13,34 +20,173 @@ NUM_WORDS = 8  # number of words to place
 
 BASE_DIR = os.path.dirname(__file__)
 WORDLIST_PATH = os.path.join(BASE_DIR, "wordlist.txt")
+LOCAL_DEFS_PATH = os.path.join(BASE_DIR, "defs.json")  # optional, bundled
+DEFINITION_CACHE_PATH = os.path.join(BASE_DIR, "definition_cache.json")
+
+# One private RNG for the module; generate_crossword(seed=...) reseeds it
+_rng = random.Random()
 
 # ------------------------------
 # LOAD WORDLIST
 # ------------------------------
+
+def _load_or_build_cache(path, min_len, max_len):
+    """
+    Return {length: [words]} for min_len..max_len.
+
+    The parsed wordlist (every alphabetic word, grouped by length) is pickled
+    next to the text file and reused until the text file is modified.
+    """
+    cache_path = path + ".cache.pkl"
+    by_len = None
+    try:
+        if os.path.getmtime(cache_path) >= os.path.getmtime(path):
+            with open(cache_path, "rb") as f:
+                by_len = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        by_len = None
+
+    if by_len is None:
+        by_len = {}
+        # One read, then one word per line; bytes.isalpha() is ASCII-only,
+        # so accented entries are dropped, as are multi-word lines
+        with open(path, "rb") as f:
+            data = f.read().lower()
+        for w in data.splitlines():
+            w = w.strip()
+            if not w.isalpha():
+                continue
+            by_len.setdefault(len(w), []).append(w.decode("ascii"))
+        try:
+            tmp_path = cache_path + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump(by_len, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # read-only install; just skip the cache
+
+    # The list repeats a few words (choir, knack, pearl); drop the extra
+    # copies here so pickles built before this still load clean
+    return {
+        L: list(dict.fromkeys(ws))
+        for L, ws in by_len.items() if min_len <= L <= max_len
+    }
+
 def load_words(min_len=WORD_MIN, max_len=WORD_MAX):
-    words = []
-    with open(WORDLIST_PATH, "r", encoding="utf-8") as f:
-        for line in f:
-            w = line.strip().lower()
-            if w.isalpha() and min_len <= len(w) <= max_len:
-                words.append(w)
-    return words
+    by_len = _load_or_build_cache(WORDLIST_PATH, min_len, max_len)
+    return [w for ws in by_len.values() for w in ws]
 
-words_pool = load_words()
+def build_word_index(words):
+    """
+    Bucket words by length and index them by (length, position, letter):
+    index[L][pos][ch] is the set of indices into by_len[L] of words with
+    ch at pos.
+    """
+    by_len = {}
+    for w in words:
+        by_len.setdefault(len(w), []).append(w)
+    index = {}
+    for L, ws in by_len.items():
+        per_pos = [{} for _ in range(L)]
+        for i, w in enumerate(ws):
+            for pos, ch in enumerate(w):
+                per_pos[pos].setdefault(ch, set()).add(i)
+        index[L] = per_pos
+    return by_len, index
+
+@lru_cache(maxsize=None)
+def load_word_index():
+    """
+    Return (words_by_len, word_index, lengths_by_room), built once per run.
+    lengths_by_room[n] lists the word lengths that fit in a run of n cells,
+    so a start cell near the edge only ever draws from lengths it can hold.
+    """
+    words_by_len, word_index = build_word_index(load_words())
+    lengths_by_room = {
+        room: sorted(L for L in words_by_len if L <= room)
+        for room in range(1, GRID_SIZE + 1)
+    }
+    return words_by_len, word_index, lengths_by_room
 
 # ------------------------------
 # FETCH DEFINITIONS
 # ------------------------------
+# One pooled session so repeated lookups reuse a keep-alive connection
+_session = requests.Session()
+_session.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(total=2, backoff_factor=0.3),
+))
+
+_definition_cache_lock = threading.Lock()
+
+
+def load_definition_cache():
+    try:
+        with open(DEFINITION_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def ensure_definition_cache():
+    """Read definition_cache.json into definition_cache on first use."""
+    global _definition_cache_loaded
+    with _definition_cache_lock:
+        if not _definition_cache_loaded:
+            for word, definition in load_definition_cache().items():
+                definition_cache.setdefault(word, definition)
+            _definition_cache_loaded = True
+
+
+def save_definition_cache():
+    """Write definition_cache to disk atomically (temp file + os.replace)."""
+    with _definition_cache_lock:
+        # The file is shared with the 5x5 script, so merge rather than
+        # overwrite whatever it (or an earlier run) already stored there
+        merged = load_definition_cache()
+        merged.update(definition_cache)
+        tmp_path = DEFINITION_CACHE_PATH + ".tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(merged, f)
+            os.replace(tmp_path, DEFINITION_CACHE_PATH)
+        except OSError:
+            pass  # read-only install; the in-memory cache still works
+
+
+# Filled from definition_cache.json on the first lookup, so importing
+# stays I/O-free
 definition_cache = {}
+_definition_cache_loaded = False
+
+@lru_cache(maxsize=None)
+def load_local_definitions():
+    """{word: definition} from a bundled defs.json, or {} when there is none."""
+    try:
+        with open(LOCAL_DEFS_PATH, "r", encoding="utf-8") as f:
+            defs = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return defs if isinstance(defs, dict) else {}
+
 
 def get_definition(word):
+    # A bundled definition needs no network
+    local = load_local_definitions().get(word)
+    if local:
+        return local
+
+    ensure_definition_cache()
     if word in definition_cache:
         return definition_cache[word]
     try:
-        response = requests.get(f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}")
+        response = _session.get(f"https://api.dictionaryapi.dev/api/v2/entries/en/{word}", timeout=5)
         data = response.json()
         if isinstance(data, list) and 'meanings' in data[0]:
             definition = data[0]['meanings'][0]['definitions'][0]['definition']
+            # generate_crossword() saves once after every lookup is done
             definition_cache[word] = definition
             return definition
     except:
@@ -50,48 +196,18 @@ def get_definition(word):
 # ------------------------------
 # CROSSWORD GENERATION
 # ------------------------------
-grid = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-number_grid = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
-words_info = []
-number_counter = 1
-
-def can_place(word, row, col, direction):
-    """Check if word fits at position with overlap rules."""
+def place_word(grid, number_grid, words_info, word, row, col, direction, clue):
+    if number_grid[row][col] == 0:
+        # Numbers are handed out in order and every one belongs to a placed
+        # word, so the next free number is one past the count in use
+        number = len({w["number"] for w in words_info}) + 1
+        number_grid[row][col] = number
+    else:
+        number = number_grid[row][col]
     if direction == 'across':
-        if col + len(word) > GRID_SIZE:
-            return False
-        for i, letter in enumerate(word):
-            cell = grid[row][col+i]
-            if cell not in (None, letter):
-                return False
-        return True
-    else:  # down
-        if row + len(word) > GRID_SIZE:
-            return False
-        for i, letter in enumerate(word):
-            cell = grid[row+i][col]
-            if cell not in (None, letter):
-                return False
-        return True
-
-def place_word(word, row, col, direction, clue):
-    global number_counter
-    if direction == 'across':
-        if number_grid[row][col] == 0:
-            number_grid[row][col] = number_counter
-            number = number_counter
-            number_counter += 1
-        else:
-            number = number_grid[row][col]
         for i, letter in enumerate(word):
             grid[row][col+i] = letter
     else:  # down
-        if number_grid[row][col] == 0:
-            number_grid[row][col] = number_counter
-            number = number_counter
-            number_counter += 1
-        else:
-            number = number_grid[row][col]
         for i, letter in enumerate(word):
             grid[row+i][col] = letter
 
@@ -104,108 +220,243 @@ def place_word(word, row, col, direction, clue):
         "clue": clue
     })
 
-def generate_crossword():
+def generate_crossword(seed=None):
+    """Return (grid, number_grid, words_info) for a freshly placed puzzle."""
+    if seed is not None:
+        _rng.seed(seed)
+    words_by_len, word_index, lengths_by_room = load_word_index()
+    grid = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    number_grid = [[0 for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    words_info = []
+
     placed_words = 0
     attempts = 0
     max_attempts = 300
-    used_words = set()
+    placed = set()
+    pending = []  # definition lookups, in words_info order
+    ensure_definition_cache()
+    cached = len(definition_cache)
+    lookups = ThreadPoolExecutor(max_workers=NUM_WORDS)
     while placed_words < NUM_WORDS and attempts < max_attempts:
-        word = random.choice([w for w in words_pool if w not in used_words])
-        direction = random.choice(['across', 'down'])
-        row = random.randint(0, GRID_SIZE-1)
-        col = random.randint(0, GRID_SIZE-1)
-        if can_place(word, row, col, direction):
-            clue = get_definition(word)
-            place_word(word, row, col, direction, clue)
-            used_words.add(word)
-            placed_words += 1
         attempts += 1
+        direction = _rng.choice(['across', 'down'])
+        row = _rng.randint(0, GRID_SIZE-1)
+        col = _rng.randint(0, GRID_SIZE-1)
+        room = GRID_SIZE - (col if direction == 'across' else row)
+        lengths = lengths_by_room[room]
+        if not lengths:
+            continue
+        L = _rng.choice(lengths)
+
+        # Only words agreeing with the letters already in this run can fit,
+        # so intersect the index sets instead of scanning random words
+        candidates = None
+        for i in range(L):
+            cell = grid[row][col+i] if direction == 'across' else grid[row+i][col]
+            if cell is not None:
+                hits = word_index[L][i].get(cell, set())
+                candidates = hits if candidates is None else candidates & hits
+        if candidates is None:
+            # Nothing to match yet: index the bucket directly, no copy
+            candidates = range(len(words_by_len[L]))
+        elif not candidates:
+            continue
+        else:
+            # Sets of small ints iterate in a fixed order, so one unsorted
+            # copy keeps seeded runs reproducible without an O(n log n) sort
+            candidates = tuple(candidates)
+
+        word = words_by_len[L][_rng.choice(candidates)]
+        if word in placed:
+            continue
+        # Look the clue up in the background while placement carries on
+        pending.append(lookups.submit(get_definition, word))
+        place_word(grid, number_grid, words_info, word, row, col, direction, None)
+        placed.add(word)
+        placed_words += 1
     # Fill empty cells with black squares if no letters
     for r in range(GRID_SIZE):
         for c in range(GRID_SIZE):
             if grid[r][c] is None:
                 grid[r][c] = None  # explicitly mark as blocked
 
-generate_crossword()
+    for info, lookup in zip(words_info, pending):
+        info["clue"] = lookup.result()
+    lookups.shutdown()
+    if len(definition_cache) != cached:
+        save_definition_cache()
+    return grid, number_grid, words_info
 
 # ------------------------------
 # TKINTER GUI
 # ------------------------------
-root = tk.Tk()
-root.title("Mini Crossword 6x6 (NYT-style)")
+def build_gui(grid, number_grid, words_info):
+    root = tk.Tk()
+    root.title("Mini Crossword 6x6 (NYT-style)")
 
-frame = tk.Frame(root)
-frame.pack(padx=10, pady=10)
+    frame = tk.Frame(root)
+    frame.pack(padx=10, pady=10)
 
-entry_grid = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    CELL_SIZE = 35
 
-CELL_SIZE = 35
+    # The whole board is one Canvas; a single Entry is moved onto whichever
+    # cell is being typed in, instead of an Entry (and Label) per cell
+    canvas = tk.Canvas(frame, width=GRID_SIZE * CELL_SIZE,
+                       height=GRID_SIZE * CELL_SIZE, highlightthickness=0)
+    canvas.pack()
 
-for r in range(GRID_SIZE):
-    for c in range(GRID_SIZE):
-        bg_color = "white" if grid[r][c] else "black"
-        e = tk.Entry(frame, width=2, font=("Consolas", 18), justify="center",
-                     bg=bg_color, disabledbackground="black", disabledforeground="black")
-        if not grid[r][c]:
-            e.config(state='disabled')
-        e.grid(row=r, column=c, padx=1, pady=1)
-        entry_grid[r][c] = e
+    cell_items = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    letter_items = [[None for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
+    char_grid = [["" for _ in range(GRID_SIZE)] for _ in range(GRID_SIZE)]
 
-        # show number in top-left corner
-        if number_grid[r][c]:
-            lbl = tk.Label(frame, text=str(number_grid[r][c]), font=("Consolas", 8), bg=bg_color)
-            lbl.place(x=c*CELL_SIZE+2, y=r*CELL_SIZE+0)
-
-# ------------------------------
-# CHECK / REVEAL FUNCTIONS
-# ------------------------------
-def check_all():
     for r in range(GRID_SIZE):
         for c in range(GRID_SIZE):
-            e = entry_grid[r][c]
-            correct_letter = grid[r][c]
-            if not correct_letter or e.get() == '':
+            bg_color = "white" if grid[r][c] else "black"
+            x0, y0 = c * CELL_SIZE, r * CELL_SIZE
+            cell_items[r][c] = canvas.create_rectangle(
+                x0 + 1, y0 + 1, x0 + CELL_SIZE - 1, y0 + CELL_SIZE - 1,
+                fill=bg_color, outline="black",
+            )
+            if not grid[r][c]:
                 continue
-            if e.get().lower() == correct_letter.lower():
-                e.config(bg="green")
-            else:
-                e.config(bg="white")
 
-def reveal_solution():
-    for r in range(GRID_SIZE):
-        for c in range(GRID_SIZE):
-            e = entry_grid[r][c]
-            if grid[r][c]:
-                e.delete(0, tk.END)
-                e.insert(0, grid[r][c])
-                e.config(bg="lightblue")
+            # show number in top-left corner
+            if number_grid[r][c]:
+                canvas.create_text(x0 + 3, y0 + 1, text=str(number_grid[r][c]),
+                                   font=("Consolas", 8), anchor="nw")
 
-# ------------------------------
-# BUTTONS
-# ------------------------------
-button_frame = tk.Frame(root)
-button_frame.pack(pady=10)
+            letter_items[r][c] = canvas.create_text(
+                x0 + CELL_SIZE // 2, y0 + CELL_SIZE // 2 + 3,
+                text="", font=("Consolas", 18),
+            )
+
+    entry = tk.Entry(canvas, width=2, font=("Consolas", 18), justify="center",
+                     bd=0, highlightthickness=0)
+    entry_window = canvas.create_window(0, 0, window=entry, state="hidden",
+                                        width=CELL_SIZE - 6, height=CELL_SIZE - 12)
+    current = [None]  # (r, c) under the Entry
+
+    white_cells = [(r, c) for r in range(GRID_SIZE) for c in range(GRID_SIZE)
+                   if grid[r][c]]
+
+    def set_letter(r, c, ch):
+        char_grid[r][c] = ch
+        canvas.itemconfigure(letter_items[r][c], text=ch)
+
+    def set_fill(r, c, color):
+        canvas.itemconfigure(cell_items[r][c], fill=color)
+        if current[0] == (r, c):
+            entry.config(bg=color)
 
-check_btn = tk.Button(button_frame, text="Check All", command=check_all)
-check_btn.pack(side="left", padx=5)
+    def select(r, c):
+        current[0] = (r, c)
+        canvas.coords(entry_window, c * CELL_SIZE + CELL_SIZE // 2,
+                      r * CELL_SIZE + CELL_SIZE // 2 + 3)
+        canvas.itemconfigure(entry_window, state="normal")
+        entry.config(bg=canvas.itemcget(cell_items[r][c], "fill"))
+        entry.delete(0, tk.END)
+        entry.insert(0, char_grid[r][c])
+        entry.focus_set()
+
+    def on_click(event):
+        r, c = event.y // CELL_SIZE, event.x // CELL_SIZE
+        if 0 <= r < GRID_SIZE and 0 <= c < GRID_SIZE and grid[r][c]:
+            select(r, c)
+
+    def on_key(event):
+        if current[0] is None:
+            return
+        text = entry.get().strip()[-1:]
+        if entry.get() != text:
+            entry.delete(0, tk.END)
+            entry.insert(0, text)
+        set_letter(*current[0], text)
+
+    def on_tab(event):
+        # Tab walks the white cells in reading order, like the old Entry grid
+        if current[0] is not None:
+            i = white_cells.index(current[0])
+            select(*white_cells[(i + 1) % len(white_cells)])
+        return "break"
+
+    def on_arrow(dr, dc):
+        # Step in one direction, skipping blocks and wrapping at the edge
+        def handler(event):
+            if current[0] is not None:
+                r, c = current[0]
+                for _ in range(GRID_SIZE):
+                    r, c = (r + dr) % GRID_SIZE, (c + dc) % GRID_SIZE
+                    if grid[r][c]:
+                        select(r, c)
+                        break
+            return "break"
+        return handler
+
+    canvas.bind("<Button-1>", on_click)
+    entry.bind("<KeyRelease>", on_key)
+    entry.bind("<Tab>", on_tab)
+    entry.bind("<Up>", on_arrow(-1, 0))
+    entry.bind("<Down>", on_arrow(1, 0))
+    entry.bind("<Left>", on_arrow(0, -1))
+    entry.bind("<Right>", on_arrow(0, 1))
+
+    # Check / reveal functions
+    def check_all():
+        for r in range(GRID_SIZE):
+            for c in range(GRID_SIZE):
+                correct_letter = grid[r][c]
+                guess = char_grid[r][c]
+                if not correct_letter or guess == '':
+                    continue
+                if guess.lower() == correct_letter.lower():
+                    set_fill(r, c, "green")
+                else:
+                    set_fill(r, c, "white")
+
+    def reveal_solution():
+        for r in range(GRID_SIZE):
+            for c in range(GRID_SIZE):
+                if grid[r][c]:
+                    set_letter(r, c, grid[r][c])
+                    set_fill(r, c, "lightblue")
+        if current[0] is not None:
+            entry.delete(0, tk.END)
+            entry.insert(0, char_grid[current[0][0]][current[0][1]])
+
+    # Buttons
+    button_frame = tk.Frame(root)
+    button_frame.pack(pady=10)
+
+    check_btn = tk.Button(button_frame, text="Check All", command=check_all)
+    check_btn.pack(side="left", padx=5)
+
+    reveal_btn = tk.Button(button_frame, text="Reveal Solution", command=reveal_solution)
+    reveal_btn.pack(side="left", padx=5)
+
+    # Clues frame
+    clues_frame = tk.Frame(root)
+    clues_frame.pack(pady=10)
+
+    tk.Label(clues_frame, text="Across:").pack(anchor="w")
+    for w in words_info:
+        if w['dir'] == 'across':
+            tk.Label(clues_frame, text=f"{w['number']}. {w['clue']}").pack(anchor="w")
+
+    tk.Label(clues_frame, text="Down:").pack(anchor="w")
+    for w in words_info:
+        if w['dir'] == 'down':
+            tk.Label(clues_frame, text=f"{w['number']}. {w['clue']}").pack(anchor="w")
+
+    root.mainloop()
 
-reveal_btn = tk.Button(button_frame, text="Reveal Solution", command=reveal_solution)
-reveal_btn.pack(side="left", padx=5)
 
 # ------------------------------
-# CLUES FRAME
+# MAIN
 # ------------------------------
-clues_frame = tk.Frame(root)
-clues_frame.pack(pady=10)
-
-tk.Label(clues_frame, text="Across:").pack(anchor="w")
-for w in words_info:
-    if w['dir'] == 'across':
-        tk.Label(clues_frame, text=f"{w['number']}. {w['clue']}").pack(anchor="w")
+def main():
+    grid, number_grid, words_info = generate_crossword()
+    build_gui(grid, number_grid, words_info)
 
-tk.Label(clues_frame, text="Down:").pack(anchor="w")
-for w in words_info:
-    if w['dir'] == 'down':
-        tk.Label(clues_frame, text=f"{w['number']}. {w['clue']}").pack(anchor="w")
 
-root.mainloop()
+if __name__ == "__main__":
+    main()